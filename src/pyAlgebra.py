@@ -15,11 +15,20 @@ Supported operations:
         - Inversion
         - Multiplication
 
+Numbers are packed into limbs of k radix r digits each (see `_limbSize`), and the operations
+above work on whole limbs. The counters `addCount` and `mulCount` therefore count limb additions
+and limb multiplications, not single digit operations.
+
+`elementaryAdd`, `elementarySub` and `elementaryMult` are legacy single digit helpers: they are
+kept for compatibility but no longer used by the operations above.
+
 Author: Rodrigo Martín Núñez
 
 Date: 2021-2024
 """
 
+from array import array
+
 addCount = 0
 mulCount = 0
 symbols = [
@@ -41,6 +50,61 @@ symbols = [
     "f",
 ]
 
+# largest value a limb (group of radix r digits) may take, so that a limb product
+# plus carries stays within a 64-bit machine word
+limbBound = 2**30
+
+# below this many limbs, the "primary school method" is faster than Karatsuba's recursion
+karatsubaThreshold = 30
+
+# format codes that convert a whole limb to digits in a single call
+formatCodes = {2: "b", 8: "o", 10: "d", 16: "x"}
+
+# per radix, fixed-width digits for every quarter limb (filled on first use)
+digitTables = {}
+
+
+def _limbSize(r: int) -> tuple[int, int]:
+    """
+    Determines how many radix r digits are packed into one limb.
+
+    Parameters:
+        r (int): The radix of the digits, must be between 2 and 16.
+
+    Returns:
+        tuple: (k, r^k), the number of digits per limb and the limb base.
+    """
+
+    k = 1
+    while r ** (k + 1) <= limbBound:
+        k += 1
+    return k, r**k
+
+
+def _digitTable(r: int) -> tuple[list[bytes], list[bytes], int]:
+    """
+    Builds (once per radix) the fixed-width digits of every quarter limb, so that a limb can be
+    unpacked from a few table lookups. The tables hold at most a few hundred entries.
+
+    Parameters:
+        r (int): The radix of the digits, must be between 2 and 16.
+
+    Returns:
+        tuple: (table, top, c), the c digits of every value below r^c, the digits of the
+                (possibly shorter) most significant chunk of a limb, and the chunk width c.
+    """
+
+    if r not in digitTables:
+        k = _limbSize(r)[0]
+        c = -(-k // 4)
+        table = [b""]
+        for _ in range(c):
+            table = [prefix + symbols[d].encode() for prefix in table for d in range(r)]
+        t = k - (-(-k // c) - 1) * c
+        top = [digits[c - t :] for digits in table[: r**t]]
+        digitTables[r] = (table, top, c)
+    return digitTables[r]
+
 
 def removeLeadingZeros(a: str) -> str:
     """
@@ -123,6 +187,9 @@ def elementaryAdd(x: str, y: str, c: str, r: int = 10) -> str:
     Adds two single-character numbers and a carry character in a specified radix and returns the
     rightmost character of the result along with the carry.
 
+    Legacy: kept for compatibility, the operations in this module now work on whole limbs
+    and no longer call this function.
+
     Parameters:
         x (str): The first number as a single character.
         y (str): The second number as a single character.
@@ -154,6 +221,9 @@ def elementarySub(x: str, y: str, c: str, r: int = 10) -> str:
     Subtracts y and a carry c from x in a specified radix and returns the rightmost character
     of the result along with the carry.
 
+    Legacy: kept for compatibility, the operations in this module now work on whole limbs
+    and no longer call this function.
+
     Parameters:
         x (str): The minuend as a single character.
         y (str): The subtrahend as a single character.
@@ -183,6 +253,9 @@ def elementaryMult(x: str, y: str, z: str, c: str, r: int = 10) -> str:
     and the current single-character result z, all in a specified radix. Returns the
     rightmost character of the result along with the carry.
 
+    Legacy: kept for compatibility, the operations in this module now work on whole limbs
+    and no longer call this function.
+
     Parameters:
         x (str): The first multiplier as a single character.
         y (str): The second multiplier as a single character.
@@ -211,6 +284,522 @@ def elementaryMult(x: str, y: str, z: str, c: str, r: int = 10) -> str:
     return result, carry
 
 
+def _trimLimbs(x: list[int]) -> list[int]:
+    """
+    Removes the most significant zero limbs of a little-endian limb list, in place.
+
+    Parameters:
+        x (list[int]): The limbs, least significant first.
+
+    Returns:
+        list[int]: The same list without leading zero limbs.
+    """
+
+    while x and x[-1] == 0:
+        x.pop()
+    return x
+
+
+def _toLimbs(x: str, r: int = 10) -> list[int]:
+    """
+    Packs a non-negative number, given as a string in radix r, into limbs of k digits each.
+
+    Parameters:
+        x (str): The number as a string in radix r, without sign.
+        r (int): The radix in which the number is expressed, must be between 2 and 16.
+                    Default is 10.
+
+    Preconditions:
+        - Every character of `x` must be one of the first r entries of 'symbols'.
+
+    Returns:
+        list[int]: The limbs in base r^k, least significant first.
+    """
+
+    # int() would also accept '_', whitespace and uppercase digits
+    if x.strip("".join(symbols[:r])):
+        raise ValueError(f"invalid digit in '{x}' for radix {r}")
+
+    k = _limbSize(r)[0]
+    limbs = []
+    end = len(x)
+    while end > 0:
+        start = max(0, end - k)
+        limbs.append(int(x[start:end], r))
+        end = start
+    return _trimLimbs(limbs)
+
+
+def _fromLimbs(x: list[int], r: int = 10) -> str:
+    """
+    Unpacks limbs of k digits each back into a string in radix r.
+
+    Parameters:
+        x (list[int]): The limbs in base r^k, least significant first.
+        r (int): The radix in which the number is expressed, must be between 2 and 16.
+                    Default is 10.
+
+    Returns:
+        str: The number as a string in radix r, without leading zeros.
+    """
+
+    n = len(x)
+    while n and x[n - 1] == 0:
+        n -= 1
+    if n == 0:
+        return "0"
+
+    # write the digits into a single buffer, most significant limb first
+    k = _limbSize(r)[0]
+    digits = bytearray(n * k)
+    if r in formatCodes:
+        spec = "0" + str(k) + formatCodes[r]
+        for i in range(n):
+            digits[i * k : (i + 1) * k] = format(x[n - 1 - i], spec).encode()
+    else:
+        table, top, c = _digitTable(r)
+        chunkBase = r**c
+        for i in range(n):
+            limb = x[n - 1 - i]
+            # fill the limb from its least significant chunk upwards
+            end = (i + 1) * k
+            while end - c > i * k:
+                limb, d = divmod(limb, chunkBase)
+                digits[end - c : end] = table[d]
+                end -= c
+            digits[i * k : end] = top[limb]
+
+    # only the most significant limb can start with zeros
+    start = 0
+    while digits[start] == ord("0"):
+        start += 1
+    return str(memoryview(digits)[start:], "ascii")
+
+
+def _limbAdd(x: list[int], y: list[int], base: int) -> list[int]:
+    """
+    Adds two non-negative numbers given as limbs.
+
+    Parameters:
+        x (list[int]): The first number as limbs, least significant first.
+        y (list[int]): The second number as limbs, least significant first.
+        base (int): The limb base r^k.
+
+    Returns:
+        list[int]: Limbs of x+y.
+    """
+
+    if len(x) < len(y):
+        x, y = y, x
+
+    result = []
+    carry = 0
+    for i in range(len(x)):
+        t = x[i] + (y[i] if i < len(y) else 0) + carry
+        if t >= base:
+            result.append(t - base)
+            carry = 1
+        else:
+            result.append(t)
+            carry = 0
+    if carry:
+        result.append(carry)
+
+    global addCount
+    addCount += len(x)
+
+    return result
+
+
+def _limbSub(x: list[int], y: list[int], base: int) -> list[int]:
+    """
+    Subtracts two non-negative numbers given as limbs.
+
+    Parameters:
+        x (list[int]): The minuend as limbs, least significant first.
+        y (list[int]): The subtrahend as limbs, least significant first.
+        base (int): The limb base r^k.
+
+    Preconditions:
+        - x must be greater than or equal to y.
+
+    Returns:
+        list[int]: Limbs of x-y.
+    """
+
+    result = []
+    carry = 0
+    for i in range(len(x)):
+        t = x[i] - (y[i] if i < len(y) else 0) - carry
+        if t < 0:
+            result.append(t + base)
+            carry = 1
+        else:
+            result.append(t)
+            carry = 0
+
+    return _trimLimbs(result)
+
+
+def _limbMul(x: list[int], y: list[int], base: int) -> list[int]:
+    """
+    Multiplies two non-negative numbers given as limbs, using the "primary school method".
+
+    Parameters:
+        x (list[int]): The first number as limbs, least significant first.
+        y (list[int]): The second number as limbs, least significant first.
+        base (int): The limb base r^k.
+
+    Returns:
+        list[int]: Limbs of x*y.
+    """
+
+    result = [0] * (len(x) + len(y))
+    for i in range(len(x)):
+        xi = x[i]
+        if xi == 0:
+            continue
+        carry = 0
+        for j in range(len(y)):
+            t = result[i + j] + xi * y[j] + carry
+            carry = t // base
+            result[i + j] = t - carry * base
+        result[i + len(y)] = carry
+
+    global mulCount
+    mulCount += len(x) * len(y)
+
+    return _trimLimbs(result)
+
+
+def _limbKaratsuba(x: list[int], y: list[int], base: int) -> list[int]:
+    """
+    Multiplies two non-negative numbers given as limbs, using Karatsuba's recursive algorithm.
+
+    Parameters:
+        x (list[int]): The first number as limbs, least significant first.
+        y (list[int]): The second number as limbs, least significant first.
+        base (int): The limb base r^k.
+
+    Returns:
+        list[int]: Limbs of x*y.
+    """
+
+    if len(x) < karatsubaThreshold or len(y) < karatsubaThreshold:
+        return _limbMul(x, y, base)
+
+    splitLength = (max(len(x), len(y)) + 1) // 2
+
+    a = _trimLimbs(x[splitLength:])  # x(hi)
+    b = _trimLimbs(x[:splitLength])  # x(lo)
+    c = _trimLimbs(y[splitLength:])  # y(hi)
+    d = _trimLimbs(y[:splitLength])  # y(lo)
+
+    ac = _limbKaratsuba(a, c, base)
+    bd = _limbKaratsuba(b, d, base)
+    # ad + bc = [(a + b) * (c + d)] - ac - bd
+    ad_Plus_bc = _limbSub(
+        _limbSub(
+            _limbKaratsuba(_limbAdd(a, b, base), _limbAdd(c, d, base), base), ac, base
+        ),
+        bd,
+        base,
+    )
+
+    return _trimLimbs(
+        _limbAdd(
+            _limbAdd([0] * (2 * splitLength) + ac, [0] * splitLength + ad_Plus_bc, base),
+            bd,
+            base,
+        )
+    )
+
+
+class Accumulator:
+    """
+    Mutable signed integer in radix r, for iterative algorithms that would otherwise build a
+    fresh string on every step. The value is kept as packed limbs (see `_toLimbs`) in an array
+    of machine words, which is updated in place and only grows when a result needs more limbs.
+
+    Limbs at positions >= `length` are always zero.
+
+    Parameters:
+        x (str): The initial value as a string in radix r. Default is "0".
+        r (int): The radix in which the numbers are expressed, must be between 2 and 16.
+                    Default is 10.
+    """
+
+    __slots__ = ("r", "k", "base", "limbs", "length", "negative")
+
+    def __init__(self, x: str = "0", r: int = 10):
+        self.r = r
+        self.k, self.base = _limbSize(r)
+        self.limbs = array("L")
+        self.length = 0
+        self.negative = False
+        self.set(x)
+
+    def __str__(self) -> str:
+        result = _fromLimbs(self.limbs[: self.length], self.r)
+        return "-" + result if self.negative else result
+
+    def set(self, x: str) -> None:
+        """
+        Overwrites the value, reusing the current buffer.
+
+        Parameters:
+            x (str): The new value as a string in radix r.
+        """
+
+        x = removeLeadingZeros(x)
+        self.negative = x[0] == "-"
+        if self.negative:
+            x = x[1:]
+
+        limbs = _toLimbs(x, self.r)
+        self._reserve(len(limbs))
+        for i in range(len(limbs), self.length):
+            self.limbs[i] = 0
+        self.limbs[: len(limbs)] = array("L", limbs)
+        self.length = len(limbs)
+        self._normalize()
+
+    def copy(self) -> "Accumulator":
+        """
+        Returns:
+            Accumulator: A new accumulator holding the same value.
+        """
+
+        result = Accumulator("0", self.r)
+        result.limbs = self.limbs[: self.length]
+        result.length = self.length
+        result.negative = self.negative
+        return result
+
+    def isZero(self) -> bool:
+        """
+        Returns:
+            bool: True if the value is zero, False otherwise.
+        """
+
+        return self.length == 0
+
+    def iadd(self, y: "Accumulator | str") -> None:
+        """
+        Adds y in place (self <- self + y).
+
+        Parameters:
+            y (Accumulator | str): The addend, as an accumulator or a string in radix r.
+        """
+
+        y = self._operand(y)
+        self._accumulate([1], 1, y, y.negative)
+
+    def isub(self, y: "Accumulator | str") -> None:
+        """
+        Subtracts y in place (self <- self - y).
+
+        Parameters:
+            y (Accumulator | str): The subtrahend, as an accumulator or a string in radix r.
+        """
+
+        y = self._operand(y)
+        self._accumulate([1], 1, y, not y.negative)
+
+    def isubMul(self, q: "Accumulator | str", y: "Accumulator | str") -> None:
+        """
+        Subtracts the product q*y in place (self <- self - q*y), without building q*y.
+
+        Parameters:
+            q (Accumulator | str): The first factor, as an accumulator or a string in radix r.
+            y (Accumulator | str): The second factor, as an accumulator or a string in radix r.
+        """
+
+        q = self._operand(q)
+        y = self._operand(y)
+        self._accumulate(q.limbs, q.length, y, q.negative == y.negative)
+
+    def ishift(self, n: int) -> None:
+        """
+        Shifts the value n digits to the left in place (self <- self * r^n).
+
+        Parameters:
+            n (int): The number of radix r digits to shift by, must be non-negative.
+        """
+
+        if self.length == 0:
+            return
+
+        limbShift, digitShift = divmod(n, self.k)
+        limbs = self.limbs
+        self._reserve(self.length + limbShift + 1)
+
+        # move whole limbs up, starting from the most significant one
+        for i in range(self.length - 1, -1, -1):
+            limbs[i + limbShift] = limbs[i]
+        for i in range(limbShift):
+            limbs[i] = 0
+        self.length += limbShift
+
+        # multiply by the remaining r^digitShift
+        if digitShift:
+            factor = self.r**digitShift
+            carry = 0
+            for i in range(limbShift, self.length):
+                carry, limbs[i] = divmod(limbs[i] * factor + carry, self.base)
+            limbs[self.length] = carry
+            self.length += 1
+            self._normalize()
+
+    def idivmod(self, y: "Accumulator | str", q: "Accumulator | None" = None) -> None:
+        """
+        Divides by y in place using long division on limbs: self is replaced by the remainder
+        and, if given, q receives the quotient. The division truncates towards zero, so the
+        remainder keeps the sign of self.
+
+        Parameters:
+            y (Accumulator | str): The divisor, as an accumulator or a string in radix r.
+                                    Must not be zero.
+            q (Accumulator | None): Accumulator to store the quotient in, its buffer is reused.
+                                    Must not be self or y. Default is None (quotient discarded).
+        """
+
+        y = self._operand(y)
+        if y.length == 0:
+            raise ZeroDivisionError("division by zero")
+
+        quotientNegative = self.negative != y.negative
+        if q is not None:
+            q.set("0")
+
+        m = y.length
+        n = self.length
+        if n < m:
+            return
+
+        d = y.limbs
+        base = self.base
+        rem = self.limbs
+        self._reserve(n + 1)
+        if q is not None:
+            q._reserve(n - m + 1)
+        if m >= 2:
+            # the top two limbs of y, rounded up, give a quotient estimate that is never too big
+            den = d[m - 1] * base + d[m - 2] + 1
+
+        for j in range(n - m, -1, -1):
+            if m == 1:
+                qhat = (rem[j + 1] * base + rem[j]) // d[0]
+            else:
+                qhat = ((rem[j + m] * base + rem[j + m - 1]) * base + rem[j + m - 2]) // den
+            if qhat:
+                self._addMulAt(-qhat, d, m, j, j + m + 1)
+            # the estimate is at most a few units too small
+            while self._windowGreaterOrEqual(d, m, j):
+                self._addMulAt(-1, d, m, j, j + m + 1)
+                qhat += 1
+            if q is not None:
+                q.limbs[j] = qhat
+
+        self._normalize()
+        if q is not None:
+            q.length = n - m + 1
+            q.negative = quotientNegative
+            q._normalize()
+
+    def _operand(self, y: "Accumulator | str") -> "Accumulator":
+        # strings are converted, and self is copied so the buffer is not read while written
+        if isinstance(y, str):
+            return Accumulator(y, self.r)
+        if y is self:
+            return self.copy()
+        return y
+
+    def _reserve(self, n: int) -> None:
+        # grow the buffer to at least n limbs, keeping the unused limbs zero
+        if len(self.limbs) < n:
+            self.limbs.frombytes(bytes((n - len(self.limbs)) * self.limbs.itemsize))
+
+    def _normalize(self) -> None:
+        while self.length and self.limbs[self.length - 1] == 0:
+            self.length -= 1
+        if self.length == 0:
+            self.negative = False
+
+    def _addMulAt(self, f: int, y: array, yLength: int, offset: int, end: int) -> int:
+        """
+        Adds f*y*base^offset to the limbs below `end`, where f is a signed single-limb factor.
+
+        Returns:
+            int: The signed carry out of limb `end` - 1.
+        """
+
+        limbs = self.limbs
+        base = self.base
+        carry = 0
+        for i in range(yLength):
+            carry, limbs[offset + i] = divmod(limbs[offset + i] + f * y[i] + carry, base)
+        i = offset + yLength
+        while carry and i < end:
+            carry, limbs[i] = divmod(limbs[i] + carry, base)
+            i += 1
+
+        global mulCount
+        mulCount += yLength
+
+        return carry
+
+    def _windowGreaterOrEqual(self, y: array, yLength: int, offset: int) -> bool:
+        # compares the limbs self[offset .. offset + yLength] with y
+        limbs = self.limbs
+        if limbs[offset + yLength]:
+            return True
+        for i in range(yLength - 1, -1, -1):
+            if limbs[offset + i] != y[i]:
+                return limbs[offset + i] > y[i]
+        return True
+
+    def _accumulate(
+        self, q: "array | list[int]", qLength: int, y: "Accumulator", negative: bool
+    ) -> None:
+        """
+        Adds q*y in place, where q holds limbs of a magnitude and `negative` is the sign of
+        the whole term.
+        """
+
+        if qLength == 0 or y.length == 0:
+            return
+
+        # |self| moves towards zero when the term has the opposite sign
+        f = 1 if negative == self.negative else -1
+
+        # enough room for the result, so the final carry is either 0 or -1
+        n = max(self.length, qLength + y.length) + 1
+        self._reserve(n)
+
+        carry = 0
+        for i in range(qLength):
+            if q[i]:
+                carry += self._addMulAt(f * q[i], y.limbs, y.length, i, n)
+
+        if carry < 0:
+            # the limbs hold base^n - |result|, negate them and flip the sign
+            limbs = self.limbs
+            borrow = 0
+            for i in range(n):
+                t = -limbs[i] - borrow
+                if t < 0:
+                    limbs[i] = t + self.base
+                    borrow = 1
+                else:
+                    limbs[i] = t
+                    borrow = 0
+            self.negative = not self.negative
+
+        self.length = n
+        self._normalize()
+
+
 def add(x: str, y: str, r: int = 10) -> str:
     """
     Adds two numbers represented as strings in a specified radix and returns the resulting sum as a string.
@@ -246,28 +835,10 @@ def add(x: str, y: str, r: int = 10) -> str:
         # x + -y = x - y
         return subtract(x, y[1:], r)
 
-    result = ""
-    carry = "0"
-    # determine amount of times we need to do an elementary addition
-    length = 0
-    if len(x) > len(y):
-        length = len(x)
-        # add 0's to the front of y to make x and y have equal lengths
-        y = symbols[0] * (length - len(y)) + y
-    else:
-        length = len(y)
-        # add 0's to the front of x to make x and y have equal lengths
-        x = symbols[0] * (length - len(x)) + x
-
-    # add individual characters and store a carry
-    for i in range(length):
-        elemRes = elementaryAdd(x[len(x) - 1 - i], y[len(y) - 1 - i], carry, r)
-        carry = elemRes[1]
-        result = elemRes[0] + result
-
-    # if there is still a carry add it to the start of the result
-    if carry != symbols[0]:
-        result = carry + result
+    # add the numbers limb by limb, each limb holding k digits of radix r
+    result = _fromLimbs(
+        _limbAdd(_toLimbs(x, r), _toLimbs(y, r), _limbSize(r)[1]), r
+    )
 
     if bothNegative:
         result = "-" + result
@@ -310,19 +881,10 @@ def subtract(x: str, y: str, r: int = 10) -> str:
     if not greaterOrEqual(x, y):
         return "-" + subtract(y, x, r)
 
-    result = ""
-    carry = "0"
-
-    length = len(x)
-    if len(x) > len(y):
-        # add 0's to the front of y to make x and y have equal lengths
-        y = symbols[0] * (length - len(y)) + y
-
-    # subtract individual characters and store a carry
-    for i in range(length):
-        elemRes = elementarySub(x[len(x) - 1 - i], y[len(y) - 1 - i], carry, r)
-        carry = elemRes[1]
-        result = elemRes[0] + result
+    # subtract the numbers limb by limb, each limb holding k digits of radix r
+    result = _fromLimbs(
+        _limbSub(_toLimbs(x, r), _toLimbs(y, r), _limbSize(r)[1]), r
+    )
 
     return removeLeadingZeros(result)
 
@@ -358,33 +920,12 @@ def multiply(x: str, y: str, r: int = 10) -> str:
         # x * -y = - (x * y)
         return "-" + multiply(x, y[1:], r)
 
-    resultList = list(symbols[0] * (len(x) + len(y)))
-
-    for i in range(len(x)):
-        carry = "0"
-        for j in range(len(y)):
-            elemMult = elementaryMult(
-                x[len(x) - 1 - i],
-                y[len(y) - 1 - j],
-                resultList[-1 * (i + j + 1)],
-                carry,
-                r,
-            )
-            carry = elemMult[1]
-            resultList[-1 * (i + j + 1)] = elemMult[0]
-        resultList[-1 * (i + len(y) + 1)] = carry
-
-    if resultList[-1 * (len(x) + len(y))] == "0":
-        k = len(x) + len(y) - 1
-    else:
-        k = len(x) + len(y)
-
-    result = ""
-    # converting the list to a string
-    for i in resultList:
-        result += i
+    # multiply the numbers limb by limb, each limb holding k digits of radix r
+    result = _fromLimbs(
+        _limbMul(_toLimbs(x, r), _toLimbs(y, r), _limbSize(r)[1]), r
+    )
 
-    return removeLeadingZeros(result[-1 * k :])
+    return removeLeadingZeros(result)
 
 
 def karatsuba(x: str, y: str, r: int = 10) -> str:
@@ -419,43 +960,12 @@ def karatsuba(x: str, y: str, r: int = 10) -> str:
         # x * -y = - (x * y)
         return "-" + karatsuba(x, y[1:], r)
 
-    if len(x) < 2 or len(y) < 2:
-        return multiply(x, y, r)
-
-    length = max(len(x), len(y))
-
-    # add 0's to the front of x and y to make x and y have equal lengths
-    x = symbols[0] * (length - len(x)) + x
-    y = symbols[0] * (length - len(y)) + y
-
-    if not (length % 2 == 0):
-        # add 0 to the start of x and y so that they are both of even length
-        x = symbols[0] + x
-        y = symbols[0] + y
-
-    splitLength = len(x) // 2
-
-    a = x[:splitLength]  # x(hi)
-    b = x[splitLength:]  # x(lo)
-    c = y[:splitLength]  # y(hi)
-    d = y[splitLength:]  # y(lo)
-
-    ac = karatsuba(a, c, r)
-    bd = karatsuba(b, d, r)
-    # ad + bc = [(a + b) * (c + d)] - ac - bd
-    ad_Plus_bc = subtract(
-        subtract(karatsuba(add(a, b, r), add(c, d, r), r), ac, r), bd, r
+    # run the recursion on limbs, each limb holding k digits of radix r
+    result = _fromLimbs(
+        _limbKaratsuba(_toLimbs(x, r), _toLimbs(y, r), _limbSize(r)[1]), r
     )
 
-    return add(
-        add(
-            ac + (symbols[0] * (2 * splitLength)),
-            ad_Plus_bc + (symbols[0] * splitLength),
-            r,
-        ),
-        bd,
-        r,
-    )
+    return removeLeadingZeros(result)
 
 
 def extEuclid(x: str, y: str, r: int = 10) -> tuple[str, str, str]:
@@ -492,29 +1002,30 @@ def extEuclid(x: str, y: str, r: int = 10) -> tuple[str, str, str]:
     else:
         b = y
 
-    x1 = "1"
-    x2 = "0"
-    y1 = "0"
-    y2 = "1"
+    a = Accumulator(a, r)
+    b = Accumulator(b, r)
+    q = Accumulator("0", r)
+    x1 = Accumulator("1", r)
+    x2 = Accumulator("0", r)
+    y1 = Accumulator("0", r)
+    y2 = Accumulator("1", r)
 
     # use the rule gcd(a,b) = gcd(a-qb, b), as the set of common divisors is invariant
-    # stop if b becomes negative, such that gcd(a, b) = gcd(a, 0) = a
-    while greaterOrEqual(b, "1"):
-        q = divide(a, b, r)
-        remainder = subtract(a, multiply(q, b, r), r)
-
-        a = b
-        b = remainder
-
-        x3 = subtract(x1, multiply(q, x2, r), r)
-        y3 = subtract(y1, multiply(q, y2, r), r)
-
-        x1 = x2
-        y1 = y2
-        x2 = x3
-        y2 = y3
-
-    result = a
+    # stop if b becomes zero, such that gcd(a, b) = gcd(a, 0) = a
+    while not b.isZero():
+        # a <- a mod b, q <- a // b, then swap a and b
+        a.idivmod(b, q)
+        a, b = b, a
+
+        # x3 = x1 - q*x2, computed in the buffer of x1, then x1 <- x2 and x2 <- x3
+        x1.isubMul(q, x2)
+        x1, x2 = x2, x1
+        y1.isubMul(q, y2)
+        y1, y2 = y2, y1
+
+    result = str(a)
+    x1 = str(x1)
+    y1 = str(y1)
 
     # x is positive
     if greaterOrEqual(x, "0"):
@@ -549,7 +1060,8 @@ def modularReduction(n: str, m: str, r: int = 10) -> str:
         - `m` must be greater than zero.
 
     Returns:
-        str: Result of n mod m in radix r.
+        str: Result of n mod m in radix r, always in the range [0, m). In particular a negative
+            multiple of m reduces to "0".
     """
 
     n = removeLeadingZeros(n)
@@ -559,13 +1071,11 @@ def modularReduction(n: str, m: str, r: int = 10) -> str:
         n = n[1:]
         isNegative = True
 
-    i = len(n) - len(m)
-    while i >= 0:
-        ri = "1" if i == 0 else "1" + ((i - 1) * "0")
-        mri = multiply(m, ri, r)
-        while greaterOrEqual(n, mri):
-            n = subtract(n, mri, r).lstrip("0")
-        i = i - 1
+    # long division on limbs, keeping only the remainder
+    remainder = Accumulator(n, r)
+    remainder.idivmod(m)
+    n = str(remainder)
+
     if (not isNegative) or n == "0":
         return removeLeadingZeros(n)
     return removeLeadingZeros(subtract(m, n, r))
@@ -668,25 +1178,25 @@ def modularInversion(a: str, m: str, r: int = 10) -> str:
             Otherwise, prints "Inverse does not exist".
     """
 
-    originalModulo = m
-    x1 = "1"
-    x2 = "0"
-    while greaterOrEqual(m, "1"):
-        q = divide(a, m, r)
-        # remainder = a - q*m
-        remainder = subtract(a, multiply(q, m, r), r)
-        a = m
-        m = remainder
-        # x3 = x1 - q*x2
-        x3 = subtract(x1, multiply(q, x2, r), r)
-        x1 = x2
-        x2 = x3
-    if a == "1":
-        x1 = modularReduction(
-            add(modularReduction(x1, originalModulo, r), originalModulo, r),
-            originalModulo,
-            r,
-        )
-        return x1
+    # reduce a into [0, m) first, as idivmod keeps the sign of a in the remainder
+    a = Accumulator(modularReduction(a, m, r), r)
+    originalModulo = Accumulator(m, r)
+    m = originalModulo.copy()
+    q = Accumulator("0", r)
+    x1 = Accumulator("1", r)
+    x2 = Accumulator("0", r)
+    while not m.isZero():
+        # a <- a mod m, q <- a // m, then swap a and m
+        a.idivmod(m, q)
+        a, m = m, a
+        # x3 = x1 - q*x2, computed in the buffer of x1
+        x1.isubMul(q, x2)
+        x1, x2 = x2, x1
+    if str(a) == "1":
+        # reduce the Bezout coefficient x1 into [0, m) in place
+        x1.idivmod(originalModulo)
+        if x1.negative:
+            x1.iadd(originalModulo)
+        return str(x1)
     else:
         print("Inverse does not exist")
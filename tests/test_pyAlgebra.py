@@ -0,0 +1,416 @@
+import functools
+import sys
+import tracemalloc
+from random import Random
+
+import pytest
+
+import pyAlgebra as pa
+
+
+def toRadix(v: int, r: int) -> str:
+    """Reference conversion of a Python int to a string in radix r."""
+
+    if v == 0:
+        return "0"
+    digits = ""
+    a = abs(v)
+    while a:
+        a, d = divmod(a, r)
+        digits = pa.symbols[d] + digits
+    return "-" + digits if v < 0 else digits
+
+
+def limbBoundaryValues(r: int) -> list[int]:
+    """Values around limb boundaries in radix r, where carries and borrows cross limbs."""
+
+    base = pa._limbSize(r)[1]
+    magnitudes = [0, 1, r - 1, base - 1, base, base + 1, base**2 - 1, base**2, base**3 + 1]
+    return magnitudes + [-v for v in magnitudes if v]
+
+
+@pytest.mark.parametrize("r", range(2, 17))
+def test_arithmeticLimbBoundaries(r):
+    for x in limbBoundaryValues(r):
+        for y in limbBoundaryValues(r):
+            a, b = toRadix(x, r), toRadix(y, r)
+            assert pa.add(a, b, r) == toRadix(x + y, r)
+            assert pa.subtract(a, b, r) == toRadix(x - y, r)
+            # a zero product keeps the sign of the operands ("-0"), as it always did
+            if x * y:
+                assert pa.multiply(a, b, r) == toRadix(x * y, r)
+                assert pa.karatsuba(a, b, r) == toRadix(x * y, r)
+
+
+@pytest.mark.parametrize("r", range(2, 17))
+def test_arithmeticLargeOperands(r):
+    random = Random(r)
+    base = pa._limbSize(r)[1]
+    threshold = pa.karatsubaThreshold
+    # limb counts: balanced, above the threshold, and unbalanced enough that the high
+    # half of the shorter operand is empty
+    for xLimbs, yLimbs in [
+        (3, 2),
+        (threshold, threshold),
+        (2 * threshold + 7, threshold + 1),
+        (4 * threshold, threshold),
+    ]:
+        x = random.randrange(base ** (xLimbs - 1), base**xLimbs)
+        y = random.randrange(base ** (yLimbs - 1), base**yLimbs)
+        for sx, sy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+            a, b = toRadix(sx * x, r), toRadix(sy * y, r)
+            assert pa.add(a, b, r) == toRadix(sx * x + sy * y, r)
+            assert pa.subtract(b, a, r) == toRadix(sy * y - sx * x, r)
+            assert pa.multiply(a, b, r) == toRadix(sx * sy * x * y, r)
+            assert pa.karatsuba(a, b, r) == toRadix(sx * sy * x * y, r)
+            assert pa.karatsuba(b, a, r) == toRadix(sx * sy * x * y, r)
+
+
+@pytest.mark.parametrize(
+    "a, m, expected",
+    [("-1", "7", "6"), ("-4", "7", "5"), ("-3", "5", "3"), ("-371", "3429", "1867")],
+)
+def test_modularInversionNegative(a, m, expected):
+    assert pa.modularInversion(a, m) == expected
+
+
+@pytest.mark.parametrize("r", [2, 7, 10, 16])
+def test_modularInversionMatchesPow(r):
+    m = 1000003
+    for a in (-m - 5, -12345, -2, 2, 12345, 5 * m + 7):
+        expected = toRadix(pow(a, -1, m), r)
+        assert pa.modularInversion(toRadix(a, r), toRadix(m, r), r) == expected
+
+
+@pytest.mark.parametrize(
+    "n, m", [("-6", "2"), ("-7", "7"), ("-5", "1"), ("-0", "3"), ("-4c", "13")]
+)
+def test_modularReductionNegativeMultiple(n, m):
+    r = 16 if n == "-4c" else 10
+    assert pa.modularReduction(n, m, r) == "0"
+
+
+@pytest.mark.parametrize("r", [2, 3, 10, 16])
+def test_modularReductionMatchesPython(r):
+    m = 98765432123456789
+    for n in (-(10**60) - 1, -m * 7, -m - 1, -1, 0, 1, m - 1, m, 3 * m + 2, 10**60 + 1):
+        assert pa.modularReduction(toRadix(n, r), toRadix(m, r), r) == toRadix(n % m, r)
+
+
+values = [0, 1, -1, 7, -7, 10**9, -(10**9), 10**9 + 1, 2**61 - 1, -(3**80), 12345678901234567890]
+
+
+@pytest.mark.parametrize("r", [2, 3, 10, 16])
+def test_accumulatorAddSub(r):
+    for x in values:
+        for y in values:
+            acc = pa.Accumulator(toRadix(x, r), r)
+            acc.iadd(pa.Accumulator(toRadix(y, r), r))
+            assert str(acc) == toRadix(x + y, r)
+
+            acc = pa.Accumulator(toRadix(x, r), r)
+            acc.isub(toRadix(y, r))
+            assert str(acc) == toRadix(x - y, r)
+
+
+@pytest.mark.parametrize("r", [2, 10, 16])
+def test_accumulatorSubMul(r):
+    for x in values:
+        for q in values:
+            for y in values[::3]:
+                acc = pa.Accumulator(toRadix(x, r), r)
+                acc.isubMul(toRadix(q, r), pa.Accumulator(toRadix(y, r), r))
+                assert str(acc) == toRadix(x - q * y, r)
+
+
+@pytest.mark.parametrize("x", values)
+def test_accumulatorAliasing(x):
+    acc = pa.Accumulator(str(x))
+    acc.isubMul(acc, acc)
+    assert str(acc) == str(x - x * x)
+
+    acc = pa.Accumulator(str(x))
+    acc.iadd(acc)
+    assert str(acc) == str(2 * x)
+
+    acc = pa.Accumulator(str(x))
+    acc.isub(acc)
+    assert str(acc) == "0"
+    assert not acc.negative
+
+
+@pytest.mark.parametrize("r", [2, 7, 10, 16])
+def test_accumulatorShift(r):
+    k = pa._limbSize(r)[0]
+    for x in values:
+        for n in (0, 1, k - 1, k, k + 1, 3 * k + 2):
+            acc = pa.Accumulator(toRadix(x, r), r)
+            acc.ishift(n)
+            assert str(acc) == toRadix(x * r**n, r)
+
+
+def truncatedDivmod(x: int, y: int) -> tuple[int, int]:
+    q = abs(x) // abs(y)
+    if (x < 0) != (y < 0):
+        q = -q
+    return q, x - q * y
+
+
+@pytest.mark.parametrize("r", [2, 10, 16])
+def test_accumulatorDivmod(r):
+    base = pa._limbSize(r)[1]
+    divisors = [
+        1,
+        -1,
+        3,
+        base - 1,
+        base,
+        # top limb is 1
+        base + 5,
+        -(base**2 + 1),
+        base**3 + base - 1,
+        10**20 + 7,
+    ]
+    dividends = values + [base**4 - 1, -(base**5) - 3, (base**3 + base - 1) * 12345]
+    for x in dividends:
+        for y in divisors:
+            acc = pa.Accumulator(toRadix(x, r), r)
+            q = pa.Accumulator("1", r)
+            acc.idivmod(pa.Accumulator(toRadix(y, r), r), q)
+            expectedQ, expectedR = truncatedDivmod(x, y)
+            assert str(q) == toRadix(expectedQ, r)
+            assert str(acc) == toRadix(expectedR, r)
+
+
+def test_accumulatorZeroResults():
+    acc = pa.Accumulator("-123456789012")
+    acc.idivmod("123456789012")
+    assert str(acc) == "0"
+    assert not acc.negative
+
+    q = pa.Accumulator("99")
+    acc = pa.Accumulator("5")
+    acc.idivmod("123456789012", q)
+    assert str(q) == "0"
+    assert str(acc) == "5"
+
+    acc = pa.Accumulator("0")
+    acc.ishift(20)
+    assert str(acc) == "0"
+
+    with pytest.raises(ZeroDivisionError):
+        pa.Accumulator("5").idivmod("0")
+
+
+def test_accumulatorReusesBuffer():
+    acc = pa.Accumulator("9" * 100)
+    buffer = acc.limbs
+    size = len(buffer)
+    acc.set("12")
+    acc.iadd("-99999")
+    acc.isubMul("123", "456")
+    acc.idivmod("7")
+    assert acc.limbs is buffer
+    assert len(acc.limbs) == size
+
+
+def test_invalidDigits():
+    for x in ("1_0", " 1", "1 0", "A"):
+        with pytest.raises(ValueError):
+            pa.add(x, "5", 16)
+    with pytest.raises(ValueError):
+        pa.Accumulator("9", 8)
+
+
+# String-based reference loops, as extEuclid, modularInversion and modularReduction were
+# written before they moved onto Accumulator.
+
+
+def stringExtEuclid(a: str, b: str, r: int = 10) -> tuple[str, str, str]:
+    x1, x2, y1, y2 = "1", "0", "0", "1"
+    while pa.greaterOrEqual(b, "1"):
+        q = pa.divide(a, b, r)
+        remainder = pa.subtract(a, pa.multiply(q, b, r), r)
+        a, b = b, remainder
+        x3 = pa.subtract(x1, pa.multiply(q, x2, r), r)
+        y3 = pa.subtract(y1, pa.multiply(q, y2, r), r)
+        x1, y1, x2, y2 = x2, y2, x3, y3
+    return a, x1, y1
+
+
+def stringModularInversion(a: str, m: str, r: int = 10) -> str:
+    originalModulo = m
+    x1, x2 = "1", "0"
+    while pa.greaterOrEqual(m, "1"):
+        q = pa.divide(a, m, r)
+        remainder = pa.subtract(a, pa.multiply(q, m, r), r)
+        a, m = m, remainder
+        x3 = pa.subtract(x1, pa.multiply(q, x2, r), r)
+        x1, x2 = x2, x3
+    return pa.modularReduction(x1, originalModulo, r)
+
+
+def stringModularReduction(n: str, m: str, r: int = 10) -> str:
+    i = len(n) - len(m)
+    while i >= 0:
+        ri = "1" if i == 0 else "1" + ((i - 1) * "0")
+        mri = pa.multiply(m, ri, r)
+        while pa.greaterOrEqual(n, mri):
+            n = pa.subtract(n, mri, r).lstrip("0")
+        i = i - 1
+    return pa.removeLeadingZeros(n)
+
+
+def fibonacciPair(n: int) -> tuple[str, str]:
+    """Consecutive Fibonacci numbers: coprime, and every Euclid quotient is 1."""
+
+    a, b = 1, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return str(b), str(a)
+
+
+def peakAllocation(f, *args):
+    """Peak traced memory of f(*args), above what was allocated before the call."""
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = f(*args)
+        return result, tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def sampledAllocation(f, *args):
+    """
+    Runs f(*args) while sampling traced memory on every trace event. The growth of the peak
+    between two samples is added up, so memory that is allocated and freed again in between
+    is counted too.
+
+    The sampler keeps the tuple it reads the baseline from alive until the next event, so
+    its own cost is a fixed amount per event instead of overlapping (and hiding) what f
+    allocates. Frame objects only exist because of tracing and are left out.
+
+    Returns:
+        tuple: (result, bytes sampled, number of events)
+    """
+
+    total = 0
+    events = 0
+    base = 0
+    state = None
+
+    def sample(frame, event, arg):
+        nonlocal total, events, base, state
+        current, peak = tracemalloc.get_traced_memory()
+        # the interval before the first event only holds the set up of the tracer
+        if events:
+            total += peak - base
+        events += 1
+        if event == "call":
+            total -= sys.getsizeof(frame)
+        # drop everything the sampler holds, so nothing is freed after the reset
+        del current, peak
+        base = state = None
+        tracemalloc.reset_peak()
+        state = tracemalloc.get_traced_memory()
+        base = state[0]
+        return sample
+
+    tracemalloc.start()
+    try:
+        state = tracemalloc.get_traced_memory()
+        base = state[0]
+        tracemalloc.reset_peak()
+        sys.settrace(sample)
+        try:
+            result = f(*args)
+        finally:
+            sys.settrace(None)
+        return result, total, events
+    finally:
+        tracemalloc.stop()
+
+
+def idleLoop(n: int) -> None:
+    # allocates nothing as long as n stays within the cached small ints
+    i = 0
+    while i < n:
+        i += 1
+
+
+@functools.cache
+def samplerOverhead() -> tuple[float, float]:
+    """
+    Bytes the sampler itself adds, measured on loops that allocate nothing.
+
+    Returns:
+        tuple: (bytes per run, bytes per event)
+    """
+
+    _, short, shortEvents = sampledAllocation(idleLoop, 50)
+    _, long, longEvents = sampledAllocation(idleLoop, 250)
+    perEvent = (long - short) / (longEvents - shortEvents)
+    return short - shortEvents * perEvent, perEvent
+
+
+def totalAllocation(f, *args):
+    """Total bytes allocated while running f(*args), without the sampler's own cost."""
+
+    result, total, events = sampledAllocation(f, *args)
+    perRun, perEvent = samplerOverhead()
+    return result, total - perRun - events * perEvent
+
+
+def allocationCases(n: int):
+    x, y = fibonacciPair(n)
+    return [
+        (lambda a, b: pa.extEuclid(a, b)[0], lambda a, b: stringExtEuclid(a, b)[0], x, y),
+        (pa.modularInversion, stringModularInversion, x, y),
+        (pa.modularReduction, stringModularReduction, str(int(x) ** 2), y),
+    ]
+
+
+allocationIds = ["extEuclid", "modularInversion", "modularReduction"]
+
+
+@pytest.mark.parametrize("case", range(3), ids=allocationIds)
+def test_peakAllocationBelowStringReference(case):
+    f, reference, x, y = allocationCases(1000)[case]
+    result, peak = peakAllocation(f, x, y)
+    expected, referencePeak = peakAllocation(reference, x, y)
+    assert result == expected
+    assert peak < referencePeak
+
+
+def test_totalAllocationMeasuresAllocations():
+    def allocate(n):
+        i = 0
+        while i < n:
+            bytes(1000)
+            i += 1
+
+    def call(n):
+        i = 0
+        while i < n:
+            idleLoop(3)
+            i += 1
+
+    # neither lines nor calls that allocate nothing are counted
+    for n in (10, 120):
+        assert abs(totalAllocation(idleLoop, n)[1]) < 64
+        assert abs(totalAllocation(call, n)[1]) < 64
+    # memory that is freed again right away is counted
+    expected = 120 * sys.getsizeof(bytes(1000))
+    assert abs(totalAllocation(allocate, 120)[1] - expected) < 64
+
+
+@pytest.mark.parametrize("case", range(3), ids=allocationIds)
+def test_totalAllocationBelowStringReference(case):
+    f, reference, x, y = allocationCases(60)[case]
+    result, total = totalAllocation(f, x, y)
+    expected, referenceTotal = totalAllocation(reference, x, y)
+    assert result == expected
+    assert total < referenceTotal